@@ -6,12 +6,20 @@ import logging
 import hashlib
 from datetime import datetime
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 
-import PyPDF2
-import pytesseract
-from PIL import Image
+import pymupdf
+
+# OpenMP lit OMP_THREAD_LIMIT au chargement de tesserocr : la limite doit être
+# posée avant l'import. Un seul thread par processus OCR évite la
+# sur-souscription des cœurs ; exporter la variable avant le lancement pour
+# la modifier.
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+from tesserocr import PyTessBaseAPI, PSM, OEM
 from docx import Document
-from pdf2image import convert_from_path
+from docx.oxml.ns import qn
 
 # Configuration du logging
 logging.basicConfig(
@@ -23,14 +31,259 @@ logging.basicConfig(
     ]
 )
 
+
+def _ocr_concurrency():
+    """Nombre de processus OCR simultanés (variable OCR_CONCURRENCY ou nombre de cœurs)."""
+    value = os.getenv('OCR_CONCURRENCY')
+    if value:
+        try:
+            return max(1, int(value))
+        except ValueError:
+            logging.warning(f"OCR_CONCURRENCY invalide ({value}), utilisation du nombre de cœurs.")
+    return os.cpu_count() or 1
+
+
+# Caractères remplacés dans les noms de fichiers de contenu
+_SANITIZE_RE = re.compile(r'[^\w\-_.]')
+
+# Nombre de processus OCR (Tesseract limité à un thread par processus, voir
+# OMP_THREAD_LIMIT ci-dessus).
+OCR_MAX_WORKERS = _ocr_concurrency()
+
+# Résolution de rendu des pages pour l'OCR
+OCR_DPI = 200
+
+# Paramètres Tesseract, avec une attention particulière aux tableaux
+OCR_LANG = 'fra'
+OCR_PSM = PSM.SINGLE_BLOCK
+OCR_OEM = OEM.DEFAULT
+
+# Découpage des pages en bandes (en-tête / corps / pied de page) pour le cache
+# OCR par segment : la coupe est cherchée sur une ligne blanche dans ces zones
+# (fractions de la hauteur de page).
+OCR_HEADER_BAND = (0.04, 0.12)
+OCR_FOOTER_BAND = (0.88, 0.96)
+OCR_BLANK_LEVEL = 250
+
+# Version du format du cache OCR : à incrémenter quand le texte produit pour une
+# même image change (pipeline de rendu, assemblage des bandes...)
+OCR_CACHE_VERSION = 2
+
+
+# Moteur Tesseract du processus courant, créé à la première page à reconnaître
+# puis conservé pour ne charger les données de langue qu'une fois par processus.
+# L'API tesserocr n'est pas thread-safe : l'OCR n'est parallélisé que par processus.
+_tess_api = None
+
+
+def _get_tess_api():
+    """Retourne le moteur Tesseract du processus courant."""
+    global _tess_api
+    if _tess_api is None:
+        _tess_api = PyTessBaseAPI(lang=OCR_LANG, psm=OCR_PSM, oem=OCR_OEM)
+    return _tess_api
+
+
+# ContentProcessor du processus de traitement de documents courant, créé une
+# fois par _init_document_worker plutôt que transmis avec chaque fichier.
+_worker_processor = None
+
+
+def _init_document_worker(base_dir):
+    """Initialise un processus de traitement de documents.
+
+    Les documents étant déjà traités en parallèle, l'OCR de leurs pages se fait
+    séquentiellement dans ce processus plutôt que dans un second pool.
+    """
+    global OCR_MAX_WORKERS, _worker_processor
+    OCR_MAX_WORKERS = 1
+    _worker_processor = ContentProcessor(base_dir=base_dir)
+
+
+def _process_file_in_worker(file_path):
+    """Traite un fichier dans un processus initialisé par _init_document_worker."""
+    _worker_processor._process_one_file(file_path)
+
+
+_W_P, _W_TBL, _W_TR, _W_TC = qn('w:p'), qn('w:tbl'), qn('w:tr'), qn('w:tc')
+_W_R, _W_HYPERLINK, _W_T, _W_TAB, _W_PTAB = qn('w:r'), qn('w:hyperlink'), qn('w:t'), qn('w:tab'), qn('w:ptab')
+_W_BR, _W_CR, _W_NO_BREAK_HYPHEN, _W_TYPE = qn('w:br'), qn('w:cr'), qn('w:noBreakHyphen'), qn('w:type')
+
+
+def _docx_run_text(run):
+    """Retourne le texte d'un élément w:r, comme Run.text de python-docx.
+
+    Seuls les enfants directs du run sont lus : le contenu des zones de texte
+    (mc:AlternateContent) et les sauts de page sont ignorés.
+    """
+    parts = []
+    for node in run.iterchildren(_W_T, _W_TAB, _W_PTAB, _W_BR, _W_CR, _W_NO_BREAK_HYPHEN):
+        if node.tag == _W_T:
+            parts.append(node.text or '')
+        elif node.tag in (_W_TAB, _W_PTAB):
+            parts.append('\t')
+        elif node.tag == _W_NO_BREAK_HYPHEN:
+            parts.append('-')
+        elif node.tag == _W_CR or node.get(_W_TYPE) in (None, 'textWrapping'):
+            parts.append('\n')
+    return ''.join(parts)
+
+
+def _docx_paragraph_text(element):
+    """Retourne le texte d'un élément w:p (runs et liens hypertexte), comme Paragraph.text."""
+    parts = []
+    for child in element.iterchildren(_W_R, _W_HYPERLINK):
+        if child.tag == _W_R:
+            parts.append(_docx_run_text(child))
+        else:
+            parts.extend(_docx_run_text(run) for run in child.iterchildren(_W_R))
+    return ''.join(parts)
+
+
+def _docx_table_lines(element):
+    """Retourne une ligne de texte par rangée d'un élément w:tbl (cellules séparées par ' | ')."""
+    lines = []
+    for row in element.iter(_W_TR):
+        cells = []
+        for cell in row.iterchildren(_W_TC):
+            cells.append(' '.join(_docx_paragraph_text(p).strip() for p in cell.iterchildren(_W_P)).strip())
+        lines.append(' | '.join(cells))
+    return lines
+
+
+def _ocr_image(samples, width, height, bytes_per_line):
+    """Extrait le texte d'une image en niveaux de gris via OCR.
+
+    Les pixels bruts sont transmis directement à Tesseract, sans encodage
+    intermédiaire de l'image.
+    """
+    api = _get_tess_api()
+    api.SetImageBytes(samples, width, height, 1, bytes_per_line)
+    # Les octets bruts ne portent pas de résolution : sans elle, Tesseract en
+    # devine une et ses seuils de segmentation sont faussés
+    api.SetSourceResolution(OCR_DPI)
+    return api.GetUTF8Text()
+
+
+def _ocr_cache_key(kind, samples, width, height):
+    """Calcule la clé de cache OCR d'une page ou d'une bande (pixels + paramètres OCR)."""
+    params = (f"|v{OCR_CACHE_VERSION}|{kind}|{width}x{height}|{OCR_DPI}dpi"
+              f"|{OCR_LANG}|psm{OCR_PSM}|oem{OCR_OEM}"
+              f"|{OCR_HEADER_BAND}|{OCR_FOOTER_BAND}|{OCR_BLANK_LEVEL}").encode('utf-8')
+    h = hashlib.sha1(samples)
+    h.update(params)
+    return h.hexdigest()
+
+
+def _find_blank_row(samples, stride, rows):
+    """Retourne la première ligne entièrement blanche parmi rows, ou None."""
+    for y in rows:
+        if min(samples[y * stride:(y + 1) * stride]) >= OCR_BLANK_LEVEL:
+            return y
+    return None
+
+
+def _split_bands(samples, stride, height):
+    """Découpe une page en bandes horizontales (en-tête, corps, pied de page).
+
+    Les coupes sont faites sur des lignes blanches pour ne jamais trancher une
+    ligne de texte ; sans ligne blanche, la zone correspondante n'est pas
+    séparée. Retourne une liste d'intervalles (y0, y1).
+    """
+    top = _find_blank_row(samples, stride, range(int(height * OCR_HEADER_BAND[1]),
+                                                 int(height * OCR_HEADER_BAND[0]), -1))
+    bottom = _find_blank_row(samples, stride, range(int(height * OCR_FOOTER_BAND[0]),
+                                                    int(height * OCR_FOOTER_BAND[1])))
+    cuts = [0] + [y for y in (top, bottom) if y] + [height]
+    return list(zip(cuts, cuts[1:]))
+
+
+def _read_ocr_cache(cache_dir, key):
+    """Retourne le texte OCR en cache pour une clé, ou None."""
+    try:
+        with open(os.path.join(cache_dir, f"{key}.txt"), 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_ocr_cache(cache_dir, key, text):
+    """Enregistre un texte OCR dans le cache (écriture atomique)."""
+    cache_path = os.path.join(cache_dir, f"{key}.txt")
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logging.warning(f"Impossible d'écrire le cache OCR {cache_path}: {e}")
+
+
+def _ocr_pages(file_path, page_numbers, cache_dir=None):
+    """Applique l'OCR à une liste de pages d'un PDF ouvert une seule fois.
+
+    Les pages sont reconnues par le moteur Tesseract résident du processus.
+    Si cache_dir est fourni, le cache est consulté pour la page entière puis
+    pour chacune de ses bandes (en-tête, corps, pied de page) : seules les
+    bandes jamais vues sont repassées à Tesseract, ce qui évite de reconnaître
+    à nouveau les en-têtes et pieds de page communs à plusieurs documents.
+    Fonction de module (et non méthode) pour pouvoir être exécutée dans un
+    ProcessPoolExecutor. Retourne un dictionnaire {numéro de page: texte}.
+    """
+    texts = {}
+    try:
+        doc = pymupdf.open(file_path)
+    except Exception as e:
+        logging.warning(f"OCR impossible, ouverture de {file_path} échouée: {e}")
+        return texts
+
+    recognized = {}  # clé de bande -> texte, pour les bandes répétées dans le lot
+    with doc:
+        for page_number in page_numbers:
+            try:
+                pix = doc.load_page(page_number - 1).get_pixmap(dpi=OCR_DPI, colorspace=pymupdf.csGRAY)
+                samples = pix.samples
+                page_key = _ocr_cache_key('page', samples, pix.width, pix.height) if cache_dir else None
+                cached = _read_ocr_cache(cache_dir, page_key) if page_key else None
+                if cached is not None:
+                    logging.debug(f"Cache OCR utilisé pour la page {page_number} de {file_path}")
+                    texts[page_number] = cached
+                    continue
+
+                band_texts = []
+                for y0, y1 in _split_bands(samples, pix.stride, pix.height):
+                    band_samples = samples[y0 * pix.stride:y1 * pix.stride]
+                    key = _ocr_cache_key('band', band_samples, pix.width, y1 - y0)
+                    text = recognized.get(key)
+                    if text is None and cache_dir:
+                        text = _read_ocr_cache(cache_dir, key)
+                    if text is None:
+                        text = _ocr_image(band_samples, pix.width, y1 - y0, pix.stride)
+                        if cache_dir:
+                            _write_ocr_cache(cache_dir, key, text)
+                    recognized[key] = text
+                    band_texts.append(text)
+
+                text = "\n".join(band.rstrip("\n") for band in band_texts if band.strip())
+                texts[page_number] = text
+                if page_key:
+                    _write_ocr_cache(cache_dir, page_key, text)
+                logging.debug(f"OCR réussi pour la page {page_number} de {file_path}")
+            except Exception as e:
+                logging.warning(f"OCR a échoué pour la page {page_number} de {file_path}: {e}")
+    return texts
+
+
 class ContentProcessor:
     def __init__(self, base_dir="crawler_output"):
         self.base_dir = base_dir
+        self.ocr_cache_dir = os.path.join(base_dir, 'logs', 'ocr_cache')
+        self._ocr_pool_broken = False
         self.create_directories()
 
     def create_directories(self):
         """Crée la structure de dossiers nécessaire."""
-        directories = ['content', 'logs']
+        directories = ['content', 'logs', os.path.join('logs', 'ocr_cache')]
         for dir_name in directories:
             path = os.path.join(self.base_dir, dir_name)
             try:
@@ -40,122 +293,236 @@ class ContentProcessor:
                 logging.error(f"Impossible de créer le répertoire {path}: {e}")
                 raise
 
-    def sanitize_filename(self, file_path, page_number=None):
-        """Crée un nom de fichier sécurisé."""
+    def _filename_parts(self, file_path):
+        """Retourne le nom sécurisé (sans extension) et le hash d'un fichier source."""
         url_hash = hashlib.md5(file_path.encode('utf-8')).hexdigest()[:8]
         filename = os.path.basename(file_path)
         if not filename:
             filename = 'index'
-        filename = re.sub(r'[^\w\-_.]', '_', filename)
+        filename = _SANITIZE_RE.sub('_', filename)
         name, _ = os.path.splitext(filename)
+        return name, url_hash
+
+    def _page_filename(self, name, url_hash, page_number):
+        """Crée le nom du fichier de contenu d'une page à partir de _filename_parts."""
+        return f"{name}_page_{page_number:03d}_{url_hash}.txt"
+
+    def sanitize_filename(self, file_path, page_number=None):
+        """Crée un nom de fichier sécurisé."""
+        name, url_hash = self._filename_parts(file_path)
         if page_number is not None:
-            sanitized = f"{name}_page_{page_number:03d}_{url_hash}.txt"
+            sanitized = self._page_filename(name, url_hash, page_number)
         else:
             sanitized = f"{name}_{url_hash}.txt"
         logging.debug(f"Nom de fichier sanitizé: {sanitized}")
         return sanitized
 
-    def extract_text_from_pdf(self, file_path):
-        """Extrait le contenu de chaque page d'un PDF."""
-        pages_content = []
+    def extract_text_from_pdf(self, file_path, ocr_executor=None):
+        """Extrait le contenu de chaque page d'un PDF.
+
+        ocr_executor est le pool OCR partagé à utiliser pour les pages
+        numérisées (voir extract_text_with_ocr).
+        Retourne deux listes parallèles : numéros de page et textes.
+        """
+        page_numbers, texts = [], []
         try:
-            with open(file_path, 'rb') as f:
-                reader = PyPDF2.PdfReader(f)
-                num_pages = len(reader.pages)
+            page_texts = {}
+            empty_pages = []
+            with pymupdf.open(file_path) as doc:
+                num_pages = doc.page_count
                 logging.info(f"Nombre de pages dans {file_path}: {num_pages}")
-                for page_number in range(num_pages):
-                    page = reader.pages[page_number]
-                    text = page.extract_text() or ""
-                    
-                    # Si le texte est vide, essayer l'OCR
+                for page_number in range(1, num_pages + 1):
+                    text = doc.load_page(page_number - 1).get_text()
+
+                    # Page sans couche texte (numérisée) : elle sera traitée par OCR
                     if not text.strip():
-                        logging.debug(f"Texte vide sur la page {page_number + 1}, tentative d'OCR.")
-                        text = self.extract_text_with_ocr(file_path, page_number + 1)
-                    
-                    if text.strip():
-                        pages_content.append({
-                            'page': page_number + 1,
-                            'text': text.strip()
-                        })
-        except PyPDF2.errors.PdfReadError as e:
+                        logging.debug(f"Aucun texte natif sur la page {page_number}, tentative d'OCR.")
+                        empty_pages.append(page_number)
+                    else:
+                        page_texts[page_number] = text
+
+            if empty_pages:
+                page_texts.update(self.extract_text_with_ocr(file_path, empty_pages, ocr_executor))
+
+            for page_number in sorted(page_texts):
+                text = page_texts[page_number].strip()
+                if text:
+                    page_numbers.append(page_number)
+                    texts.append(text)
+        except pymupdf.FileDataError as e:
             logging.error(f"Erreur de lecture du PDF {file_path}: {e}")
         except Exception as e:
             logging.error(f"Erreur lors de l'extraction du PDF {file_path}: {e}")
-        return pages_content
+        return page_numbers, texts
+
+    def extract_text_with_ocr(self, file_path, page_numbers, executor=None):
+        """Applique l'OCR aux pages données, réparties sur plusieurs processus.
 
-    def extract_text_with_ocr(self, file_path, page_number):
-        """Extrait le texte via OCR avec une attention particulière aux tableaux."""
+        executor est un pool de processus partagé entre documents, dont les
+        processus gardent leur moteur Tesseract chargé ; à défaut, un pool
+        est créé pour ce seul document.
+        Retourne un dictionnaire {numéro de page: texte}.
+        """
+        workers = min(OCR_MAX_WORKERS, len(page_numbers))
+        if executor is None:
+            if workers <= 1:
+                return _ocr_pages(file_path, page_numbers, self.ocr_cache_dir)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return self.extract_text_with_ocr(file_path, page_numbers, executor)
+
+        # Chaque processus rouvre le PDF une seule fois pour son lot de pages
+        batches = [page_numbers[i::workers] for i in range(workers)]
+        logging.info(f"OCR de {len(page_numbers)} pages de {file_path} sur {workers} processus")
+        texts = {}
         try:
-            images = convert_from_path(file_path, first_page=page_number, last_page=page_number)
-            if images:
-                custom_config = r'--oem 3 --psm 6'
-                text = pytesseract.image_to_string(images[0], lang='fra', config=custom_config)
-                logging.debug(f"OCR réussi pour la page {page_number} de {file_path}")
-                return text
-            logging.warning(f"Aucune image extraite pour la page {page_number} de {file_path}")
-            return ""
-        except Exception as e:
-            logging.warning(f"OCR a échoué pour la page {page_number} de {file_path}: {e}")
-            return ""
+            for batch_texts in executor.map(partial(_ocr_pages, file_path, cache_dir=self.ocr_cache_dir), batches):
+                texts.update(batch_texts)
+        except BrokenProcessPool as e:
+            # Un processus OCR mort (ex. plantage natif de Tesseract) casse le
+            # pool : les lots déjà reçus et les pages natives restent exploités
+            logging.error(f"OCR interrompu pour {file_path}, pages non reconnues ignorées: {e}")
+            self._ocr_pool_broken = True
+        return texts
 
     def extract_text_from_docx(self, file_path):
-        """Extrait le texte des fichiers DOCX."""
-        pages_content = []
+        """Extrait le texte des fichiers DOCX.
+
+        Retourne deux listes parallèles : numéros de page et textes.
+        """
+        page_numbers, texts = [], []
         try:
             doc = Document(file_path)
             current_text = []
             page_number = 1  # DOCX n'a pas de pages strictes
-            for paragraph in doc.paragraphs:
-                current_text.append(paragraph.text.strip())
-            pages_content.append({
-                'page': page_number,
-                'text': "\n".join(current_text)
-            })
+            # Parcours direct de l'arbre XML, dans l'ordre du document, sans
+            # créer d'objet Paragraph/Table python-docx par élément
+            for element in doc.element.body.iterchildren(_W_P, _W_TBL):
+                if element.tag == _W_P:
+                    current_text.append(_docx_paragraph_text(element).strip())
+                else:
+                    current_text.extend(_docx_table_lines(element))
+            page_numbers.append(page_number)
+            texts.append("\n".join(current_text))
             logging.debug(f"Extraction DOCX réussie pour {file_path}")
         except Exception as e:
             logging.error(f"Erreur lors de l'extraction du DOCX {file_path}: {e}")
-        return pages_content
+        return page_numbers, texts
+
+    def _process_files_in_pool(self, file_paths, workers):
+        """Traite des fichiers dans un pool de processus neuf.
+
+        Retourne les fichiers inachevés parce qu'un processus du pool s'est
+        arrêté brutalement.
+        """
+        unfinished = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_document_worker,
+                                 initargs=(self.base_dir,)) as executor:
+            futures = [(file_path, executor.submit(_process_file_in_worker, file_path))
+                       for file_path in file_paths]
+            for file_path, future in futures:
+                try:
+                    future.result()
+                except BrokenProcessPool:
+                    unfinished.append(file_path)
+        return unfinished
 
     def process_files_in_directory(self, directory):
-        """Traite tous les fichiers PDF et DOCX dans un répertoire donné."""
+        """Traite tous les fichiers PDF et DOCX dans un répertoire donné.
+
+        Avec au moins autant de fichiers que de processus OCR, les fichiers sont
+        traités en parallèle (un par processus) ; sinon ils sont traités un à un
+        et ce sont les pages à OCR de chaque PDF qui sont parallélisées.
+        """
         logging.info(f"Processing files in directory: {directory}")
+        file_paths = []
         for root, _, files in os.walk(directory):
             for file in files:
                 file_ext = os.path.splitext(file)[1].lower()
                 if file_ext in ['.pdf', '.doc', '.docx']:
-                    file_path = os.path.join(root, file)
-                    logging.info(f"Processing file: {file_path}")
-                    try:
-                        if file_ext == '.pdf':
-                            pages_content = self.extract_text_from_pdf(file_path)
-                        elif file_ext in ['.doc', '.docx']:
-                            pages_content = self.extract_text_from_docx(file_path)
-                        else:
-                            logging.warning(f"Unsupported file type: {file_ext} for file {file_path}")
-                            continue
-
-                        if not pages_content:
-                            logging.warning(f"No content extracted from {file_path}")
-                            continue
-
-                        for page_data in pages_content:
-                            if not page_data.get('text'):
-                                continue
-
-                            # Générer le nom de fichier brut
-                            filename = self.sanitize_filename(file_path, page_number=page_data['page'])
-                            save_path = os.path.join(self.base_dir, 'content', filename)
-
-                            # Sauvegarder le contenu brut en .txt
-                            try:
-                                with open(save_path, 'w', encoding='utf-8') as f:
-                                    f.write(page_data['text'])
-                                logging.info(f"Contenu brut sauvegardé dans : {save_path}")
-                            except IOError as e:
-                                logging.error(f"Erreur de sauvegarde pour {file_path} page {page_data['page']}: {e}")
-
-                    except Exception as e:
-                        logging.error(f"Erreur lors du traitement de {file_path}: {e}", exc_info=True)
+                    file_paths.append(os.path.join(root, file))
+
+        if OCR_MAX_WORKERS > 1 and len(file_paths) >= OCR_MAX_WORKERS:
+            logging.info(f"Traitement de {len(file_paths)} fichiers sur {OCR_MAX_WORKERS} processus")
+            # Un processus mort (ex. plantage natif de Tesseract) casse le pool :
+            # les fichiers inachevés sont repris dans un nouveau pool tant que
+            # des fichiers aboutissent, puis isolés un par un pour écarter le
+            # fichier fautif
+            pending = file_paths
+            while pending:
+                unfinished = self._process_files_in_pool(pending, OCR_MAX_WORKERS)
+                if len(unfinished) == len(pending):
+                    logging.warning(f"Reprise isolée de {len(unfinished)} fichiers après l'arrêt brutal d'un processus")
+                    for file_path in unfinished:
+                        if self._process_files_in_pool([file_path], 1):
+                            logging.error(f"Erreur lors du traitement de {file_path}: processus interrompu")
+                    break
+                if unfinished:
+                    logging.warning(f"Reprise de {len(unfinished)} fichiers après l'arrêt brutal d'un processus")
+                pending = unfinished
+        elif OCR_MAX_WORKERS > 1:
+            # Un seul pool OCR pour tout le répertoire : ses processus gardent
+            # leur moteur Tesseract chargé d'un document à l'autre
+            ocr_executor = ProcessPoolExecutor(max_workers=OCR_MAX_WORKERS)
+            try:
+                for file_path in file_paths:
+                    self._ocr_pool_broken = False
+                    self._process_one_file(file_path, ocr_executor)
+                    if self._ocr_pool_broken:
+                        logging.warning("Pool OCR remplacé après l'arrêt brutal d'un processus")
+                        ocr_executor.shutdown()
+                        ocr_executor = ProcessPoolExecutor(max_workers=OCR_MAX_WORKERS)
+            finally:
+                ocr_executor.shutdown()
+        else:
+            for file_path in file_paths:
+                self._process_one_file(file_path)
+
+    def _process_one_file(self, file_path, ocr_executor=None):
+        """Extrait le contenu d'un fichier et le sauvegarde page par page."""
+        logging.info(f"Processing file: {file_path}")
+        file_ext = os.path.splitext(file_path)[1].lower()
+        try:
+            if file_ext == '.pdf':
+                page_numbers, texts = self.extract_text_from_pdf(file_path, ocr_executor)
+            elif file_ext in ['.doc', '.docx']:
+                page_numbers, texts = self.extract_text_from_docx(file_path)
+            else:
+                logging.warning(f"Unsupported file type: {file_ext} for file {file_path}")
+                return
+
+            if not page_numbers:
+                logging.warning(f"No content extracted from {file_path}")
+                return
+
+            # Nom et hash calculés une fois par fichier plutôt qu'à chaque page
+            name, url_hash = self._filename_parts(file_path)
+            writes = []
+            for page_number, text in zip(page_numbers, texts):
+                if not text:
+                    continue
+
+                # Générer le nom de fichier brut
+                filename = self._page_filename(name, url_hash, page_number)
+                save_path = os.path.join(self.base_dir, 'content', filename)
+                writes.append((page_number, save_path, text))
+
+            self.save_pages(file_path, writes)
+
+        except Exception as e:
+            logging.error(f"Erreur lors du traitement de {file_path}: {e}", exc_info=True)
+
+    def save_pages(self, file_path, writes):
+        """Sauvegarde le contenu brut des pages d'un document en .txt.
+
+        writes est une liste de tuples (numéro de page, chemin, texte).
+        """
+        for page_number, save_path, text in writes:
+            try:
+                with open(save_path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                logging.info(f"Contenu brut sauvegardé dans : {save_path}")
+            except IOError as e:
+                logging.error(f"Erreur de sauvegarde pour {file_path} page {page_number}: {e}")
 
     def run_pipeline(self, pdf_directory, doc_directory):
         """Exécute le pipeline de traitement sur les répertoires PDF et Doc."""